@@ -0,0 +1,163 @@
+import os
+import re
+import io
+import sys
+import logging
+from typing import List, Dict, Tuple, Optional
+
+try:
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except Exception:
+    HAS_PDFIUM = False
+
+try:
+    import PyPDF2
+    HAS_PYPDF2 = True
+except Exception:
+    HAS_PYPDF2 = False
+
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+    HAS_PDFMINER = True
+except Exception:
+    HAS_PDFMINER = False
+
+try:
+    import re2
+    HAS_RE2 = True
+except Exception:
+    HAS_RE2 = False
+
+PDF_VALUE_SCAN_HEAD = int(os.getenv("PDF_VALUE_SCAN_HEAD", "8192"))
+PDF_VALUE_SCAN_LIMIT = int(os.getenv("PDF_VALUE_SCAN_LIMIT", str(256 * 1024)))
+PDF_VALUE_RE2 = os.getenv("PDF_VALUE_RE2", "1").lower() in ("1", "true", "yes")
+
+logger = logging.getLogger("bse-scraper")
+
+def _extract_pdf_text_pdfium(content: bytes) -> Tuple[str, Optional[List[Dict]]]:
+    pdf = pdfium.PdfDocument(content)
+    try:
+        out = []
+        size = 0
+        head_values = None
+        for page in pdf:
+            try:
+                textpage = page.get_textpage()
+                try:
+                    out.append(textpage.get_text_bounded() or "")
+                finally:
+                    textpage.close()
+            except Exception:
+                continue
+            finally:
+                page.close()
+            size += len(out[-1]) + 1
+            if head_values is None and size > PDF_VALUE_SCAN_HEAD:
+                head_values = _scan_order_values("\n".join(out)[:PDF_VALUE_SCAN_HEAD])
+                if head_values:
+                    break
+            if size > PDF_VALUE_SCAN_LIMIT:
+                break
+        return "\n".join(out), head_values
+    finally:
+        pdf.close()
+
+def extract_pdf_text(content: bytes, use_pdfium: bool = True) -> Tuple[str, Optional[List[Dict]]]:
+    if HAS_PDFIUM and use_pdfium:
+        try:
+            text, head_values = _extract_pdf_text_pdfium(content)
+            if text.strip():
+                return text, head_values
+        except Exception as e:
+            logger.debug(f"pypdfium2 failed: {e}")
+    if HAS_PYPDF2:
+        try:
+            reader = PyPDF2.PdfReader(io.BytesIO(content))
+            out = []
+            for page in reader.pages:
+                try:
+                    out.append(page.extract_text() or "")
+                except Exception:
+                    continue
+            if out:
+                return "\n".join(out), None
+        except Exception as e:
+            logger.debug(f"PyPDF2 failed: {e}")
+    if HAS_PDFMINER:
+        try:
+            with io.BytesIO(content) as buf:
+                return pdfminer_extract_text(buf) or "", None
+        except Exception as e:
+            logger.debug(f"pdfminer failed: {e}")
+    return "", None
+
+_VALUE_PATTERN = r"(?P<num>\d[\d,]*(?:\.\d+)?)\s*(?P<unit>crores?|cr|lakhs?|million|mn|billion|bn|[mb])\b"
+
+def _compile_value_re():
+    if HAS_RE2 and PDF_VALUE_RE2:
+        try:
+            opts = re2.Options()
+            opts.case_sensitive = False
+            return re2.compile(_VALUE_PATTERN, opts)
+        except Exception as e:
+            logger.warning(f"re2 unavailable for value scan, using re: {e}")
+    return re.compile(_VALUE_PATTERN, re.IGNORECASE)
+
+_VALUE_RE = _compile_value_re()
+
+_UNIT_TO_CRORES = {
+    sys.intern(unit): (sys.intern(unit), scale)
+    for unit, scale in (
+        ("crore", 1.0),
+        ("crores", 1.0),
+        ("cr", 1.0),
+        ("lakh", 0.01),
+        ("lakhs", 0.01),
+        ("million", 0.1),
+        ("mn", 0.1),
+        ("m", 0.1),
+        ("billion", 100.0),
+        ("bn", 100.0),
+        ("b", 100.0),
+    )
+}
+
+def _scan_order_values(text: str) -> List[Dict]:
+    found = []
+    seen = set()
+    for m in _VALUE_RE.finditer(text):
+        try:
+            value = float(m.group("num").replace(",", ""))
+        except ValueError:
+            continue
+        raw_unit = m.group("unit")
+        unit, scale = _UNIT_TO_CRORES.get(raw_unit) or _UNIT_TO_CRORES.get(raw_unit.lower(), (raw_unit.lower(), 0.0))
+        crores = value * scale
+        if crores <= 0:
+            continue
+        key = (round(value, 4), unit)
+        if key in seen:
+            continue
+        seen.add(key)
+        found.append({
+            "value": value,
+            "unit": unit,
+            "formatted": f"₹{value:,.2f} {unit}",
+            "value_in_crores": round(crores, 4),
+        })
+    return found
+
+def extract_order_value_from_text(text: str, head_values: Optional[List[Dict]] = None) -> List[Dict]:
+    text = text or ""
+    if head_values is None:
+        head_values = _scan_order_values(text[:PDF_VALUE_SCAN_HEAD])
+    if not head_values and len(text) > PDF_VALUE_SCAN_HEAD:
+        return _scan_order_values(text[:PDF_VALUE_SCAN_LIMIT])
+    return head_values
+
+def parse_pdf_bytes(content: bytes, use_pdfium: bool = True) -> Tuple[List[Dict], str]:
+    text, head_values = extract_pdf_text(content, use_pdfium)
+    values = extract_order_value_from_text(text, head_values)
+    snippet = (text or "")[:500] or "No text extracted from PDF"
+    return values, snippet
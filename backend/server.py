@@ -1,20 +1,35 @@
 import os
 import re
-import io
 import json
+import gzip
 import time
 import hmac
+import hashlib
+import secrets
 import uuid
+import queue
+import atexit
+import heapq
+import itertools
 import logging
 import threading
+import multiprocessing
 from datetime import datetime, timezone, date, timedelta
-from typing import List, Dict, Tuple, Optional
-from urllib.parse import urlparse
+from typing import List, Dict, Tuple, Optional, Mapping
+from functools import lru_cache
+from operator import itemgetter
+from collections import OrderedDict
+from bisect import bisect_right
+from urllib.parse import parse_qs
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 
 import requests
-from flask import Flask, request, jsonify
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, request, jsonify, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
 from selenium import webdriver
@@ -23,57 +38,124 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pdf_parse import parse_pdf_bytes
 
 try:
     from zoneinfo import ZoneInfo
 except Exception:
     ZoneInfo = None
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 SCRAPER_TZ = os.getenv("SCRAPER_TZ", "Asia/Kolkata")
 
+_IS_PARSE_WORKER = (
+    __name__ == "__mp_main__"
+    or multiprocessing.parent_process() is not None
+    or bool(getattr(multiprocessing.current_process(), "_inheriting", False))
+)
+
 try:
-    import PyPDF2
-    HAS_PYPDF2 = True
+    import httpx
+    import h2  # noqa: F401
+    HAS_HTTPX_H2 = True
 except Exception:
-    HAS_PYPDF2 = False
+    HAS_HTTPX_H2 = False
 
 try:
-    from pdfminer.high_level import extract_text as pdfminer_extract_text
-    HAS_PDFMINER = True
+    import orjson
+    HAS_ORJSON = True
 except Exception:
-    HAS_PDFMINER = False
+    HAS_ORJSON = False
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 HEADLESS = os.getenv("HEADLESS", "1").lower() in ("1", "true", "yes")
 PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "90"))
 SELENIUM_WAIT = int(os.getenv("SELENIUM_WAIT", "25"))
+EMPTY_RESULTS_SETTLE_SECONDS = float(os.getenv("EMPTY_RESULTS_SETTLE_SECONDS", "0.8"))
 PDF_TIMEOUT = int(os.getenv("PDF_TIMEOUT", "45"))
+PDF_PARSE_TIMEOUT = float(os.getenv("PDF_PARSE_TIMEOUT", "60"))
+PDF_RESULT_TIMEOUT = float(os.getenv("PDF_RESULT_TIMEOUT", str(PDF_TIMEOUT * 2 + PDF_PARSE_TIMEOUT)))
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "*")
 MAX_PDF_BYTES = int(os.getenv("MAX_PDF_BYTES", str(15 * 1024 * 1024)))
 API_KEY = os.getenv("API_KEY", "").strip()
 MIN_DATE = date(2010, 1, 1)
 JOB_TTL_MINUTES = int(os.getenv("JOB_TTL_MINUTES", "120"))
+JOB_SWEEP_SECONDS = int(os.getenv("JOB_SWEEP_SECONDS", "60"))
+MAX_FINISHED_JOBS = max(1, int(os.getenv("MAX_FINISHED_JOBS", "256")))
+RESULTS_MAX_WAIT_SECONDS = float(os.getenv("RESULTS_MAX_WAIT_SECONDS", "30"))
+RESULTS_MAX_WAITERS = max(0, int(os.getenv("RESULTS_MAX_WAITERS", "16")))
+MAX_STATUS_BATCH = int(os.getenv("MAX_STATUS_BATCH", "50"))
+MAX_RANGE_DAYS = max(1, int(os.getenv("MAX_RANGE_DAYS", "31")))
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+SSE_MAX_STREAM_SECONDS = float(os.getenv("SSE_MAX_STREAM_SECONDS", "120"))
+SSE_RETRY_MS = int(os.getenv("SSE_RETRY_MS", "3000"))
 UA = os.getenv("SCRAPER_UA", "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118 Safari/537.36")
 
 CACHE_DIR = Path(os.getenv("CACHE_DIR", "data/cache"))
 CACHE_TTL_MINUTES = int(os.getenv("CACHE_TTL_MINUTES", "1440"))
 PDF_WORKERS = int(os.getenv("PDF_WORKERS", "4"))
+PDF_PARSE_PROCESSES = int(os.getenv("PDF_PARSE_PROCESSES", str(PDF_WORKERS)))
+PDF_HTTP2 = os.getenv("PDF_HTTP2", "1").lower() in ("1", "true", "yes")
 
 USAGE_FILE = Path(os.getenv("USAGE_FILE", "data/analysis_runs.count"))
-
-DATES_STORE_FILE = Path(os.getenv("DATES_STORE_FILE", "data/dates.index"))
 BLOCK_HEAVY_RESOURCES = os.getenv("BLOCK_HEAVY_RESOURCES", "1").lower() in ("1", "true", "yes")
+BSE_ANN_API = os.getenv("BSE_ANN_API", "1").lower() in ("1", "true", "yes")
+BSE_ANN_API_URL = os.getenv("BSE_ANN_API_URL", "https://api.bseindia.com/BseIndiaAPI/api/AnnGetData/w")
+BSE_ANN_API_MAX_PAGES = int(os.getenv("BSE_ANN_API_MAX_PAGES", "200"))
+BSE_ANN_API_TIMEOUT = float(os.getenv("BSE_ANN_API_TIMEOUT", "20"))
+BSE_ATTACHMENT_BASE = "https://www.bseindia.com/xml-data/corpfiling/AttachLive/"
+BSE_ATTACHMENT_HIS_BASE = "https://www.bseindia.com/xml-data/corpfiling/AttachHis/"
+
+DRIVER_POOL_MIN = int(os.getenv("DRIVER_POOL_MIN", "0"))
+DRIVER_POOL_MAX = max(1, int(os.getenv("DRIVER_POOL_MAX", "2")))
+DRIVER_MAX_AGE_MINUTES = int(os.getenv("DRIVER_MAX_AGE_MINUTES", "30"))
+DRIVER_MAX_USES = int(os.getenv("DRIVER_MAX_USES", "20"))
+SCRAPE_CONCURRENCY = max(1, int(os.getenv("SCRAPE_CONCURRENCY", str(DRIVER_POOL_MAX))))
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", str(CACHE_DIR / "chrome-profile")).strip()
+CHROME_DISK_CACHE_BYTES = int(os.getenv("CHROME_DISK_CACHE_BYTES", str(50 * 1024 * 1024)))
 
 PDF_CACHE_TTL_MINUTES = int(os.getenv("PDF_CACHE_TTL_MINUTES", "10080"))
 PDF_CACHE_MAX_ENTRIES = int(os.getenv("PDF_CACHE_MAX_ENTRIES", "256"))
+PDF_NEG_CACHE_SECONDS = int(os.getenv("PDF_NEG_CACHE_SECONDS", "3600"))
+PDF_CACHE_DIR = Path(os.getenv("PDF_CACHE_DIR", str(CACHE_DIR / "pdf")))
+JOB_SPILL_DIR = Path(os.getenv("JOB_SPILL_DIR", str(CACHE_DIR / "jobs")))
+JOB_SPILL_AFTER_MINUTES = int(os.getenv("JOB_SPILL_AFTER_MINUTES", "10"))
 
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": UA})
-
-_pdf_mem_cache: Dict[str, Tuple[datetime, List[Dict], str]] = {}
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=PDF_WORKERS,
+    pool_maxsize=PDF_WORKERS * 2,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=("GET",)),
+))
+
+HTTP2_CLIENT = None
+if PDF_HTTP2 and HAS_HTTPX_H2 and not _IS_PARSE_WORKER:
+    HTTP2_CLIENT = httpx.Client(
+        headers={"User-Agent": UA},
+        timeout=PDF_TIMEOUT,
+        follow_redirects=True,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=PDF_WORKERS * 2, max_keepalive_connections=PDF_WORKERS),
+        ),
+    )
+
+_PDF_CACHE_SHARDS = 16
+_pdf_mem_cache: List[Tuple[Dict[str, Tuple[datetime, List[Dict], str]], threading.Lock]] = [
+    (OrderedDict(), threading.Lock()) for _ in range(_PDF_CACHE_SHARDS)
+]
+_pdf_mem_cache_shard_max = max(1, -(-PDF_CACHE_MAX_ENTRIES // _PDF_CACHE_SHARDS))
 _pdf_mem_cache_ttl = timedelta(minutes=PDF_CACHE_TTL_MINUTES)
-_pdf_cache_lock = threading.Lock()
+_pdf_neg_cache: Dict[str, Tuple[float, str]] = OrderedDict()
+_pdf_neg_cache_lock = threading.Lock()
 
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s | %(levelname)s | %(threadName)s | %(message)s")
 logger = logging.getLogger("bse-scraper")
@@ -83,7 +165,39 @@ def _parse_origins(origins: str):
         return "*"
     return [o.strip() for o in origins.split(",") if o.strip()]
 
+class OrjsonProvider(DefaultJSONProvider):
+    def _orjson_option(self) -> int:
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs.get("indent") or kwargs.get("cls"):
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=kwargs.get("default", self.default), option=self._orjson_option()).decode("utf-8")
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._orjson_option() | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 app = Flask(__name__)
+if HAS_ORJSON:
+    app.json = OrjsonProvider(app)
 CORS(
     app,
     resources={
@@ -102,16 +216,56 @@ def add_security_headers(resp):
     resp.headers["X-Content-Type-Options"] = "nosniff"
     resp.headers["X-Frame-Options"] = "DENY"
     resp.headers["Referrer-Policy"] = "no-referrer"
-    resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, proxy-revalidate, max-age=0"
+    resp.headers.setdefault("Cache-Control", "no-store, no-cache, must-revalidate, proxy-revalidate, max-age=0")
     return resp
 
+_API_KEY_BYTES = API_KEY.encode("utf-8")
+
 def _require_api_key() -> bool:
-    if not API_KEY:
+    if not _API_KEY_BYTES:
         return True
-    h = request.headers.get("X-API-Key", "")
-    qs = request.args.get("api_key", "")
-    key = h or qs
-    return bool(key) and hmac.compare_digest(key, API_KEY)
+    key = request.headers.get("X-API-Key") or request.args.get("api_key")
+    return bool(key) and hmac.compare_digest(key.encode("utf-8"), _API_KEY_BYTES)
+
+_KEY_GATED_PATHS = frozenset({"/api/scrape", "/api/scrape_range", "/api/status", "/api/events", "/api/results", "/api/stop"})
+_ALLOWED_ORIGINS = _parse_origins(ALLOWED_ORIGINS)
+_UNAUTHORIZED_BODY = b'{"error":"Unauthorized"}\n'
+
+class KeyGate:
+    __slots__ = ("wsgi_app",)
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        if (
+            _API_KEY_BYTES
+            and environ.get("PATH_INFO") in _KEY_GATED_PATHS
+            and environ.get("REQUEST_METHOD") != "OPTIONS"
+        ):
+            key = environ.get("HTTP_X_API_KEY")
+            if not key:
+                key = (parse_qs(environ.get("QUERY_STRING", "")).get("api_key") or [""])[0]
+            if not key or not hmac.compare_digest(key.encode("utf-8"), _API_KEY_BYTES):
+                headers = [
+                    ("Content-Type", "application/json"),
+                    ("Content-Length", str(len(_UNAUTHORIZED_BODY))),
+                    ("X-Content-Type-Options", "nosniff"),
+                    ("Cache-Control", "no-store"),
+                ]
+                origin = environ.get("HTTP_ORIGIN")
+                if _ALLOWED_ORIGINS == "*":
+                    headers.append(("Access-Control-Allow-Origin", "*"))
+                elif origin and origin in _ALLOWED_ORIGINS:
+                    headers.append(("Access-Control-Allow-Origin", origin))
+                    headers.append(("Vary", "Origin"))
+                start_response("401 UNAUTHORIZED", headers)
+                return [_UNAUTHORIZED_BODY]
+        return self.wsgi_app(environ, start_response)
+
+app.wsgi_app = KeyGate(app.wsgi_app)
+
+ANALYSIS_RUNS_FLUSH_SECONDS = float(os.getenv("ANALYSIS_RUNS_FLUSH_SECONDS", "5"))
 
 _analysis_runs_lock = threading.Lock()
 
@@ -123,7 +277,7 @@ def _ensure_analysis_runs_file():
     except Exception as e:
         logger.warning(f"Could not prepare analysis runs file: {e}")
 
-def _read_analysis_runs():
+def _load_analysis_runs_file() -> int:
     try:
         return int(USAGE_FILE.read_text().strip())
     except Exception:
@@ -132,34 +286,69 @@ def _read_analysis_runs():
 def _write_analysis_runs(v: int):
     try:
         USAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        USAGE_FILE.write_text(str(v))
+        tmp = USAGE_FILE.with_suffix(USAGE_FILE.suffix + ".tmp")
+        tmp.write_text(str(v))
+        os.replace(tmp, USAGE_FILE)
     except Exception as e:
         logger.warning(f"Could not write analysis runs file: {e}")
 
+if not _IS_PARSE_WORKER:
+    _ensure_analysis_runs_file()
+_analysis_runs_state: Tuple[int, int] = (0 if _IS_PARSE_WORKER else _load_analysis_runs_file(), 0)
+_ANALYSIS_RUN_SHARDS = 16
+_analysis_runs_shards = [[0, threading.Lock()] for _ in range(_ANALYSIS_RUN_SHARDS)]
+_analysis_runs_shard_ids = itertools.count()
+_analysis_runs_local = threading.local()
+
+def _read_analysis_runs():
+    base, flushed = _analysis_runs_state
+    return base + sum(shard[0] for shard in _analysis_runs_shards) - flushed
+
 def _increment_analysis_runs():
+    shard = getattr(_analysis_runs_local, "shard", None)
+    if shard is None:
+        shard = _analysis_runs_local.shard = _analysis_runs_shards[next(_analysis_runs_shard_ids) % _ANALYSIS_RUN_SHARDS]
+    with shard[1]:
+        shard[0] += 1
+    return _read_analysis_runs()
+
+def _flush_analysis_runs():
+    global _analysis_runs_state
     with _analysis_runs_lock:
-        current = _read_analysis_runs()
-        new_count = current + 1
+        base, flushed = _analysis_runs_state
+        total = sum(shard[0] for shard in _analysis_runs_shards)
+        if total == flushed:
+            return
+        new_count = max(_load_analysis_runs_file(), base) + total - flushed
         _write_analysis_runs(new_count)
-        return new_count
+        _analysis_runs_state = (new_count, total)
+
+def _analysis_runs_flusher():
+    while True:
+        time.sleep(ANALYSIS_RUNS_FLUSH_SECONDS)
+        _flush_analysis_runs()
+
+if not _IS_PARSE_WORKER:
+    threading.Thread(target=_analysis_runs_flusher, name="usage-flush", daemon=True).start()
+    atexit.register(_flush_analysis_runs)
 
-_ensure_analysis_runs_file()
+_counter_bodies: Dict[Tuple[str, ...], Tuple[int, bytes]] = {}
+
+def _counter_response(keys: Tuple[str, ...]):
+    count = _read_analysis_runs()
+    cached = _counter_bodies.get(keys)
+    if cached is None or cached[0] != count:
+        cached = (count, _json_dumps({k: count for k in keys}))
+        _counter_bodies[keys] = cached
+    return app.response_class(cached[1], mimetype="application/json")
 
 @app.route("/api/usage", methods=["GET"])
 def usage_get():
-    return jsonify({
-        "analysis_runs": _read_analysis_runs(),
-        "total_usage": _read_analysis_runs()
-    }), 200
+    return _counter_response(("analysis_runs", "total_usage"))
 
 @app.route("/api/visit", methods=["GET"])
 def visit_get():
-    return jsonify({
-        "visits": _read_analysis_runs(),
-        "analysis_runs": _read_analysis_runs()
-    }), 200
-
-_dates_index_lock = threading.Lock()
+    return _counter_response(("analysis_runs", "visits"))
 
 def _now_in_config_tz() -> datetime:
     if ZoneInfo:
@@ -175,51 +364,107 @@ def is_today_formatted(formatted_date: str) -> bool:
     except Exception:
         return False
 
-def _dates_index_load() -> set:
+def _pdf_disk_cache_path(url: str) -> Path:
+    return PDF_CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+def _pdf_disk_cache_get(url: str) -> Optional[Tuple[datetime, List[Dict], str]]:
+    path = _pdf_disk_cache_path(url)
     try:
-        if not DATES_STORE_FILE.exists():
-            return set()
-        return {line.strip() for line in DATES_STORE_FILE.read_text(encoding="utf-8").splitlines() if line.strip()}
-    except Exception:
-        return set()
+        ts = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+    except OSError:
+        return None
+    if datetime.now(timezone.utc) - ts > _pdf_mem_cache_ttl:
+        return None
+    try:
+        data = _json_loads(path.read_bytes())
+        return ts, data["values"], data["snippet"]
+    except Exception as e:
+        logger.debug(f"PDF cache load failed for {url}: {e}")
+        return None
 
-def _dates_index_add(formatted_date: str):
+def _pdf_disk_cache_put(url: str, values: List[Dict], snippet: str):
     try:
-        with _dates_index_lock:
-            DATES_STORE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            existing = _dates_index_load()
-            if formatted_date not in existing:
-                with DATES_STORE_FILE.open("a", encoding="utf-8") as f:
-                    f.write(formatted_date + "\n")
+        path = _pdf_disk_cache_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(_json_dumps({"url": url, "values": values, "snippet": snippet}))
+        os.replace(tmp, path)
     except Exception as e:
-        logger.debug(f"Failed to update date index: {e}")
+        logger.debug(f"PDF cache save failed for {url}: {e}")
 
-def _pdf_cache_get(url: str) -> Optional[Tuple[List[Dict], str]]:
-    now = datetime.now(timezone.utc)
-    with _pdf_cache_lock:
-        entry = _pdf_mem_cache.get(url)
-        if not entry:
+def _pdf_mem_cache_shard(url: str) -> Tuple[Dict[str, Tuple[datetime, List[Dict], str]], threading.Lock]:
+    return _pdf_mem_cache[hash(url) % _PDF_CACHE_SHARDS]
+
+def _pdf_neg_cache_get(url: str) -> Optional[str]:
+    with _pdf_neg_cache_lock:
+        entry = _pdf_neg_cache.get(url)
+        if entry is None:
             return None
+        if entry[0] > time.monotonic():
+            return entry[1]
+        del _pdf_neg_cache[url]
+    return None
+
+def _pdf_neg_cache_put(url: str, error: str):
+    if PDF_NEG_CACHE_SECONDS <= 0:
+        return
+    with _pdf_neg_cache_lock:
+        _pdf_neg_cache[url] = (time.monotonic() + PDF_NEG_CACHE_SECONDS, error)
+        _pdf_neg_cache.move_to_end(url)
+        while len(_pdf_neg_cache) > PDF_CACHE_MAX_ENTRIES:
+            _pdf_neg_cache.popitem(last=False)
+
+def _pdf_cache_get(url: str) -> Optional[Tuple[List[Dict], str]]:
+    shard, lock = _pdf_mem_cache_shard(url)
+    with lock:
+        entry = shard.get(url)
+        if entry:
+            shard.move_to_end(url)
+    if entry:
         ts, values, snippet = entry
-        if now - ts > _pdf_mem_cache_ttl:
-            _pdf_mem_cache.pop(url, None)
-            return None
-        return values, snippet
+        if datetime.now(timezone.utc) - ts <= _pdf_mem_cache_ttl:
+            return values, snippet
+        with lock:
+            if shard.get(url) is entry:
+                del shard[url]
+    error = _pdf_neg_cache_get(url)
+    if error is not None:
+        return [], error
+    entry = _pdf_disk_cache_get(url)
+    if not entry:
+        return None
+    ts, values, snippet = entry
+    _pdf_mem_cache_put(url, values, snippet, ts)
+    return values, snippet
+
+def _pdf_mem_cache_put(url: str, values: List[Dict], snippet: str, ts: Optional[datetime] = None):
+    shard, lock = _pdf_mem_cache_shard(url)
+    with lock:
+        shard[url] = (ts or datetime.now(timezone.utc), values, snippet)
+        shard.move_to_end(url)
+        while len(shard) > _pdf_mem_cache_shard_max:
+            shard.popitem(last=False)
 
 def _pdf_cache_put(url: str, values: List[Dict], snippet: str):
-    now = datetime.now(timezone.utc)
-    with _pdf_cache_lock:
-        _pdf_mem_cache[url] = (now, values, snippet)
-        if len(_pdf_mem_cache) > PDF_CACHE_MAX_ENTRIES:
-            items = sorted(_pdf_mem_cache.items(), key=lambda kv: kv[1])
-            to_drop = len(_pdf_mem_cache) - PDF_CACHE_MAX_ENTRIES
-            for i in range(to_drop):
-                _pdf_mem_cache.pop(items[i][0], None)
-
-def setup_driver(headless: bool = True) -> webdriver.Chrome:
+    _pdf_mem_cache_put(url, values, snippet)
+    _pdf_disk_cache_put(url, values, snippet)
+
+def setup_driver(headless: bool = True, profile_dir: Optional[Path] = None) -> webdriver.Chrome:
     opts = Options()
     if headless:
         opts.add_argument("--headless=new")
+    if profile_dir:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        for lock in ("SingletonLock", "SingletonSocket", "SingletonCookie"):
+            try:
+                (profile_dir / lock).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Could not clear Chrome {lock}: {e}")
+        opts.add_argument(f"--user-data-dir={profile_dir}")
+        opts.add_argument(f"--disk-cache-dir={profile_dir / 'cache'}")
+        opts.add_argument(f"--disk-cache-size={CHROME_DISK_CACHE_BYTES}")
     opts.page_load_strategy = "eager"
     opts.add_argument("--disable-gpu")
     opts.add_argument("--disable-software-rasterizer")
@@ -231,6 +476,7 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     opts.add_argument("--no-default-browser-check")
     opts.add_argument("--hide-scrollbars")
     opts.add_argument("--mute-audio")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
     opts.add_argument("--disable-blink-features=AutomationControlled")
     opts.add_argument(f"--user-agent={UA}")
     opts.add_argument("--remote-debugging-pipe")
@@ -256,7 +502,9 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
                 "urls": [
                     "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
                     "*.mp4", "*.webm", "*.avi",
-                    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*.svg"
+                    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*.svg",
+                    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+                    "*googlesyndication.com*", "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*"
                 ]
             })
         except Exception as e:
@@ -264,14 +512,157 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
 
     return driver
 
-def _wait_until_css(driver: webdriver.Chrome, css: str):
+_driver_pool: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+_driver_slots = threading.BoundedSemaphore(DRIVER_POOL_MAX)
+_driver_born: Dict[int, Tuple[float, int, int]] = {}
+_driver_born_lock = threading.Lock()
+_driver_profile_slots: "queue.Queue[int]" = queue.Queue()
+for _slot in range(DRIVER_POOL_MAX):
+    _driver_profile_slots.put(_slot)
+_driver_profile_dirs: Dict[int, Tuple[Path, object]] = {}
+
+def _profile_dir_for_slot(slot: int) -> Optional[Path]:
+    if not CHROME_PROFILE_DIR:
+        return None
+    claimed = _driver_profile_dirs.get(slot)
+    if claimed:
+        return claimed[0]
+    root = Path(CHROME_PROFILE_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        _driver_profile_dirs[slot] = (root / str(slot), None)
+        return root / str(slot)
+    for n in itertools.count(slot, DRIVER_POOL_MAX):
+        lock = open(root / f"{n}.lock", "a")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            continue
+        _driver_profile_dirs[slot] = (root / str(n), lock)
+        return root / str(n)
+
+def _create_pooled_driver() -> webdriver.Chrome:
+    slot = _driver_profile_slots.get_nowait()
+    try:
+        driver = setup_driver(headless=HEADLESS, profile_dir=_profile_dir_for_slot(slot))
+    except Exception:
+        _driver_profile_slots.put(slot)
+        raise
+    with _driver_born_lock:
+        _driver_born[id(driver)] = (time.monotonic(), slot, 0)
+    return driver
+
+def _driver_expired(driver: webdriver.Chrome) -> bool:
+    with _driver_born_lock:
+        entry = _driver_born.get(id(driver))
+    return (
+        entry is None
+        or time.monotonic() - entry[0] > DRIVER_MAX_AGE_MINUTES * 60
+        or 0 < DRIVER_MAX_USES <= entry[2]
+    )
+
+def _count_driver_use(driver: webdriver.Chrome):
+    with _driver_born_lock:
+        entry = _driver_born.get(id(driver))
+        if entry:
+            _driver_born[id(driver)] = (entry[0], entry[1], entry[2] + 1)
+
+def _discard_driver(driver: webdriver.Chrome):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    with _driver_born_lock:
+        entry = _driver_born.pop(id(driver), None)
+    if entry:
+        _driver_profile_slots.put(entry[1])
+    _driver_slots.release()
+
+def acquire_driver() -> webdriver.Chrome:
     while True:
         try:
-            if driver.find_elements(By.CSS_SELECTOR, css):
-                return
+            driver = _driver_pool.get_nowait()
+        except queue.Empty:
+            if _driver_slots.acquire(blocking=False):
+                try:
+                    return _create_pooled_driver()
+                except Exception:
+                    _driver_slots.release()
+                    raise
+            try:
+                driver = _driver_pool.get(timeout=1.0)
+            except queue.Empty:
+                continue
+        if _driver_expired(driver):
+            _discard_driver(driver)
+            continue
+        return driver
+
+def release_driver(driver: webdriver.Chrome, reusable: bool = True):
+    _count_driver_use(driver)
+    if reusable and not _driver_expired(driver):
+        try:
+            driver.get("about:blank")
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except WebDriverException:
+                driver.delete_all_cookies()
+            _driver_pool.put(driver)
+            return
+        except Exception as e:
+            logger.debug(f"Driver reset failed, discarding: {e}")
+    _discard_driver(driver)
+
+def _reap_idle_drivers():
+    idle = []
+    while True:
+        try:
+            idle.append(_driver_pool.get_nowait())
+        except queue.Empty:
+            break
+    for driver in idle:
+        if _driver_expired(driver):
+            _discard_driver(driver)
+        else:
+            _driver_pool.put(driver)
+
+def _driver_pool_maintainer():
+    for _ in range(min(DRIVER_POOL_MIN, DRIVER_POOL_MAX)):
+        if not _driver_slots.acquire(blocking=False):
+            break
+        try:
+            _driver_pool.put(_create_pooled_driver())
+        except Exception as e:
+            _driver_slots.release()
+            logger.warning(f"Driver prewarm failed: {e}")
+            break
+    while True:
+        time.sleep(60)
+        try:
+            _reap_idle_drivers()
+        except Exception as e:
+            logger.debug(f"Driver reaper failed: {e}")
+
+def _shutdown_driver_pool():
+    while True:
+        try:
+            driver = _driver_pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
         except Exception:
             pass
-        time.sleep(0.25)
+
+if not _IS_PARSE_WORKER:
+    threading.Thread(target=_driver_pool_maintainer, name="driver-pool", daemon=True).start()
+    atexit.register(_shutdown_driver_pool)
+
+def _wait_until_css(driver: webdriver.Chrome, css: str):
+    WebDriverWait(driver, SELENIUM_WAIT, poll_frequency=0.1, ignored_exceptions=(WebDriverException,)).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, css))
+    )
 
 def safe_get(driver: webdriver.Chrome, url: str, wait_css: str = "body"):
     try:
@@ -280,26 +671,28 @@ def safe_get(driver: webdriver.Chrome, url: str, wait_css: str = "body"):
         pass
     _wait_until_css(driver, wait_css)
 
-def validate_date(date_str: str) -> Tuple[str, datetime]:
+@lru_cache(maxsize=512)
+def _validated_date(date_str: str, today: date) -> Tuple[str, datetime, str]:
     try:
         dt = datetime.strptime(date_str, "%Y-%m-%d")
     except ValueError:
         raise ValueError("Invalid date format. Expected YYYY-MM-DD")
     d_only = dt.date()
-    if d_only > _now_in_config_tz().date():
+    if d_only > today:
         raise ValueError("Date cannot be in the future")
     if d_only < MIN_DATE:
         raise ValueError("Date cannot be before 2010-01-01")
-    return dt.strftime("%d/%m/%Y"), dt
+    return dt.strftime("%d/%m/%Y"), dt, dt.strftime("%B %d, %Y")
+
+def validate_date(date_str: str) -> Tuple[str, datetime]:
+    formatted, dt, _ = _validated_date(date_str, _now_in_config_tz().date())
+    return formatted, dt
 
 def set_date_field(driver: webdriver.Chrome, field_id: str, date_value: str, label: str) -> bool:
     try:
-        while True:
-            els = driver.find_elements(By.ID, field_id)
-            if els:
-                el = els[0]
-                break
-            time.sleep(0.2)
+        el = WebDriverWait(driver, SELENIUM_WAIT, poll_frequency=0.1).until(
+            EC.presence_of_element_located((By.ID, field_id))
+        )
         driver.execute_script("arguments[0].removeAttribute('readonly');", el)
         driver.execute_script("arguments[0].value='';", el)
         driver.execute_script("arguments[0].value=arguments[1];", el, date_value)
@@ -309,7 +702,9 @@ def set_date_field(driver: webdriver.Chrome, field_id: str, date_value: str, lab
               e.dispatchEvent(new Event(ev, {bubbles: true}));
             }
         """, el)
-        time.sleep(0.5)
+        WebDriverWait(driver, SELENIUM_WAIT, poll_frequency=0.1).until(
+            lambda d: el.get_attribute("value") == date_value
+        )
         return True
     except Exception as e:
         logger.warning(f"Failed to set {label}: {e}")
@@ -326,15 +721,20 @@ def accept_cookies_if_any(driver):
         for xp in xpaths:
             els = driver.find_elements(By.XPATH, xp)
             if els:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", els[0])
-                time.sleep(0.2)
                 driver.execute_script("arguments[0].click();", els[0])
-                time.sleep(0.3)
+                try:
+                    WebDriverWait(driver, 2, poll_frequency=0.1).until(EC.invisibility_of_element(els[0]))
+                except TimeoutException:
+                    pass
                 return True
     except Exception:
         pass
     return False
 
+_MARK_SEEN_TABLES_JS = """
+document.querySelectorAll('table[ng-repeat="cann in CorpannData.Table"]').forEach(t => t.setAttribute('data-ow-seen', '1'));
+"""
+
 def submit_form(driver: webdriver.Chrome) -> bool:
     try:
         candidates = [
@@ -354,26 +754,23 @@ def submit_form(driver: webdriver.Chrome) -> bool:
                 break
 
         if button:
-            driver.execute_script("arguments[0].scrollIntoView({block:'center'});", button)
-            time.sleep(0.2)
             try:
                 driver.execute_script("arguments[0].disabled=false;", button)
             except Exception:
                 pass
-            driver.execute_script("""
+            driver.execute_script(_MARK_SEEN_TABLES_JS + """
                 const el = arguments[0];
                 ['mouseover','mousedown','mouseup','click'].forEach(ev =>
                   el.dispatchEvent(new MouseEvent(ev, {bubbles:true, cancelable:true}))
                 );
             """, button)
-            time.sleep(0.8)
             return True
 
         try:
             to_els = driver.find_elements(By.ID, "txtToDt")
             if to_els:
+                driver.execute_script(_MARK_SEEN_TABLES_JS)
                 to_els[0].send_keys(Keys.ENTER)
-                time.sleep(0.8)
                 return True
         except Exception:
             pass
@@ -383,17 +780,28 @@ def submit_form(driver: webdriver.Chrome) -> bool:
         logger.error(f"Error submitting form: {e}")
         return False
 
+_RESULTS_STATE_JS = """
+const tables = document.querySelectorAll('table[ng-repeat="cann in CorpannData.Table"]');
+const fresh = document.querySelectorAll('table[ng-repeat="cann in CorpannData.Table"]:not([data-ow-seen])').length;
+const body = ((document.body && document.body.innerText) || '').toLowerCase();
+return {count: tables.length, fresh: fresh, no_record: body.includes('no record')};
+"""
+
+def _fresh_results_ready(driver: webdriver.Chrome, empty_after: float) -> bool:
+    state = driver.execute_script(_RESULTS_STATE_JS) or {}
+    if state.get("fresh"):
+        return True
+    return bool(not state.get("count") and state.get("no_record") and time.monotonic() >= empty_after)
+
 def wait_for_results_or_empty(driver: webdriver.Chrome) -> bool:
-    while True:
-        try:
-            if driver.find_elements(By.CSS_SELECTOR, 'table[ng-repeat="cann in CorpannData.Table"]'):
-                return True
-            src = (driver.page_source or "").lower()
-            if "no record" in src or "no records" in src:
-                return True
-        except Exception:
-            pass
-        time.sleep(0.3)
+    empty_after = time.monotonic() + EMPTY_RESULTS_SETTLE_SECONDS
+    try:
+        WebDriverWait(driver, PAGE_LOAD_TIMEOUT, poll_frequency=0.1, ignored_exceptions=(WebDriverException,)).until(
+            lambda d: _fresh_results_ready(d, empty_after)
+        )
+        return True
+    except TimeoutException:
+        return False
 
 def get_total_announcements(driver: webdriver.Chrome) -> int:
     try:
@@ -415,11 +823,11 @@ def get_total_announcements(driver: webdriver.Chrome) -> int:
         pass
     return 0
 
+_NORMALIZE_TRANS = str.maketrans({"_": " ", "-": " "})
+
+@lru_cache(maxsize=8192)
 def normalize_text(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = s.replace("_", " ").replace("-", " ")
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return " ".join((s or "").lower().translate(_NORMALIZE_TRANS).split())
 
 ORDER_KEYWORDS = [
     "award of order",
@@ -435,86 +843,133 @@ ORDER_KEYWORDS = [
     "loi",
 ]
 
+_ORDER_KEYWORDS_RE = re.compile("|".join(re.escape(k) for k in ORDER_KEYWORDS))
+_SINGLE_WORD_KEYWORDS = frozenset(k for k in ORDER_KEYWORDS if " " not in k)
+
 def is_order_announcement(title: str, summary: str = "") -> bool:
     hay = normalize_text(title) + " || " + normalize_text(summary)
-    if "announcement under regulation 30" in hay and ("award of order" in hay or "receipt of order" in hay):
+    if not _SINGLE_WORD_KEYWORDS.isdisjoint(hay.split(" ")):
         return True
-    return any(k in hay for k in ORDER_KEYWORDS)
-
+    return _ORDER_KEYWORDS_RE.search(hay) is not None
+
+def match_order_announcements(items: List[Tuple[str, str]]) -> List[bool]:
+    hits = [False] * len(items)
+    pending = []
+    for i, (title, summary) in enumerate(items):
+        hay = normalize_text(title) + " || " + normalize_text(summary)
+        if not _SINGLE_WORD_KEYWORDS.isdisjoint(hay.split(" ")):
+            hits[i] = True
+        else:
+            pending.append((i, hay))
+    starts = []
+    pos = 0
+    for _, hay in pending:
+        starts.append(pos)
+        pos += len(hay) + 1
+    for m in _ORDER_KEYWORDS_RE.finditer("\n".join(hay for _, hay in pending)):
+        hits[pending[bisect_right(starts, m.start()) - 1][0]] = True
+    return hits
+
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+
+@lru_cache(maxsize=4096)
 def clean_company_name(company: str, title: str) -> str:
     name = (company or "").strip()
     if not name and title:
         parts = title.split(" - ")
         if parts:
             name = parts[0].strip()
-    name = re.sub(r"\s*\([^)]*\)\s*$", "", name)
+    name = _TRAILING_PAREN_RE.sub("", name)
     return name.title() if name else ""
 
+_SCRAPE_PAGE_JS = """
+const text = (el) => ((el && el.innerText) || '').trim();
+return Array.from(document.querySelectorAll('table[ng-repeat="cann in CorpannData.Table"]')).map((table) => {
+  const rows = Array.from(table.querySelectorAll('tr'));
+  const cells = rows.length ? Array.from(rows[0].querySelectorAll('td')) : [];
+  let title = '';
+  const titleSpan = table.querySelector("span[ng-bind-html='cann.NEWSSUB']");
+  if (titleSpan) {
+    title = text(titleSpan);
+  } else {
+    if (cells.length > 1) title = text(cells[1]);
+    if (!title) {
+      for (const sp of table.querySelectorAll('span')) {
+        const t = text(sp);
+        if (t.includes('Announcement under Regulation 30') || t.includes('Order') || t.includes('Contract')) {
+          title = t;
+          break;
+        }
+      }
+    }
+  }
+  return {
+    company: cells.length ? text(cells[0]) : '',
+    title: title,
+    rows: rows.slice(1).map(text),
+    links: Array.from(table.querySelectorAll('a')).map((a) => a.href || ''),
+  };
+});
+"""
+
+def _new_order(page_num: int, idx: int, company: str, title: str, summary: str, pdf_link: Optional[str]) -> Dict:
+    clean = clean_company_name(company, title)
+    pdf_link = pdf_link or "No PDF available"
+    return {
+        "page": page_num,
+        "announcement_num": idx,
+        "company": clean,
+        "raw_company": company,
+        "title": title,
+        "summary": summary or "No summary available",
+        "pdf_link": pdf_link,
+        "order_values": [],
+        "total_value_crores": 0.0,
+        "pdf_extract": "Not parsed",
+        "_dedup_key": (clean.lower(), title.lower(), pdf_link.lower()),
+    }
+
 def scrape_announcement_tables_on_page(driver: webdriver.Chrome, page_num: int, sink: List[Dict], stop_event: threading.Event) -> int:
     try:
         _wait_until_css(driver, 'table[ng-repeat="cann in CorpannData.Table"]')
     except Exception:
         return 0
 
-    tables = driver.find_elements(By.CSS_SELECTOR, 'table[ng-repeat="cann in CorpannData.Table"]')
+    try:
+        records = driver.execute_script(_SCRAPE_PAGE_JS) or []
+    except Exception as e:
+        logger.warning(f"Failed to read announcements on page {page_num}: {e}")
+        return 0
+
+    parsed = []
+    for rec in records:
+        title = (rec.get("title") or "").strip()
+        summary = ""
+        for txt in rec.get("rows") or []:
+            txt = (txt or "").strip()
+            if txt and txt != title and len(txt) > 10:
+                summary = txt
+                break
+        parsed.append((title, summary))
+    hits = match_order_announcements(parsed)
+
     count = 0
-    for idx, table in enumerate(tables, 1):
+    for idx, (rec, (title, summary), hit) in enumerate(zip(records, parsed, hits), 1):
         if stop_event.is_set():
             break
+        if not hit:
+            continue
         try:
-            rows = table.find_elements(By.TAG_NAME, "tr")
-            first_cells = rows[0].find_elements(By.TAG_NAME, "td") if rows else []
-            company = first_cells[0].text.strip() if first_cells else ""
-
-            title = ""
-            try:
-                title_span = table.find_element(By.CSS_SELECTOR, "span[ng-bind-html='cann.NEWSSUB']")
-                title = title_span.text.strip()
-            except Exception:
-                if first_cells and len(first_cells) > 1:
-                    title = first_cells[1].text.strip()
-                if not title:
-                    for sp in table.find_elements(By.TAG_NAME, "span"):
-                        t = sp.text.strip()
-                        if "Announcement under Regulation 30" in t or "Order" in t or "Contract" in t:
-                            title = t
-                            break
-
-            summary = ""
-            try:
-                for r in rows[1:]:
-                    txt = r.text.strip()
-                    if txt and txt != title and len(txt) > 10:
-                        summary = txt
-                        break
-            except Exception:
-                pass
-
-            if not is_order_announcement(title, summary):
-                continue
+            company = (rec.get("company") or "").strip()
 
             pdf_link = None
-            try:
-                for a in table.find_elements(By.TAG_NAME, "a"):
-                    href = (a.get_attribute("href") or "").strip()
-                    if ".pdf" in href.lower() or "download" in href.lower():
-                        pdf_link = ("https://www.bseindia.com" + href) if href.startswith("/") else href
-                        break
-            except Exception:
-                pass
+            for href in rec.get("links") or []:
+                href = (href or "").strip()
+                if ".pdf" in href.lower() or "download" in href.lower():
+                    pdf_link = ("https://www.bseindia.com" + href) if href.startswith("/") else href
+                    break
 
-            sink.append({
-                "page": page_num,
-                "announcement_num": idx,
-                "company": clean_company_name(company, title),
-                "raw_company": company,
-                "title": title,
-                "summary": summary or "No summary available",
-                "pdf_link": pdf_link or "No PDF available",
-                "order_values": [],
-                "total_value_crores": 0.0,
-                "pdf_extract": "Not parsed",
-            })
+            sink.append(_new_order(page_num, idx, company, title, summary, pdf_link))
             count += 1
         except Exception as e:
             logger.debug(f"Error processing announcement {idx}: {e}")
@@ -539,188 +994,336 @@ def click_next_if_available(driver: webdriver.Chrome) -> bool:
             cls = (next_btn.get_attribute("class") or "").lower()
             if "disabled" in cls or "ng-hide" in cls:
                 continue
-            driver.execute_script("arguments[0].click();", next_btn)
-            time.sleep(1.0)
-            return True
+            driver.execute_script(_MARK_SEEN_TABLES_JS + "arguments[0].click();", next_btn)
+            break
         except Exception:
             continue
-    return False
+    else:
+        return False
+    try:
+        WebDriverWait(driver, SELENIUM_WAIT, poll_frequency=0.1, ignored_exceptions=(WebDriverException,)).until(
+            lambda d: _fresh_results_ready(d, float("inf"))
+        )
+    except TimeoutException:
+        raise RuntimeError("Next page of announcements did not load in time")
+    return True
 
-def handle_pagination_and_scrape(driver: webdriver.Chrome, stop_event: threading.Event) -> List[Dict]:
+def handle_pagination_and_scrape(driver: webdriver.Chrome, stop_event: threading.Event, prefetched: Optional[Dict[str, Future]] = None) -> List[Dict]:
     page_num = 1
     orders: List[Dict] = []
     while True:
         if stop_event.is_set():
             break
+        start = len(orders)
         scrape_announcement_tables_on_page(driver, page_num, orders, stop_event)
+        if prefetched is not None:
+            prefetch_order_pdfs(orders[start:], prefetched)
         if stop_event.is_set():
             break
         moved = click_next_if_available(driver)
         if not moved:
             break
-        time.sleep(0.5)
         page_num += 1
     return orders
 
+def _ann_api_rows_total(data: Dict) -> Optional[int]:
+    try:
+        return int((data.get("Table1") or [{}])[0].get("ROWCNT"))
+    except (TypeError, ValueError, AttributeError, IndexError):
+        return None
+
+def _ann_api_text(row: Dict, key: str) -> str:
+    value = row.get(key)
+    return str(value).strip() if value is not None else ""
+
+def _ann_api_pdf_link(row: Dict) -> Optional[str]:
+    attachment = _ann_api_text(row, "ATTACHMENTNAME")
+    if not attachment:
+        return None
+    return (BSE_ATTACHMENT_HIS_BASE if _ann_api_text(row, "PDFFLAG") == "1" else BSE_ATTACHMENT_BASE) + attachment
+
+def fetch_announcements_via_api(formatted_date: str, stop_event: threading.Event, prefetched: Optional[Dict[str, Future]] = None) -> Optional[Tuple[List[Dict], int]]:
+    day = datetime.strptime(formatted_date, "%d/%m/%Y").strftime("%Y%m%d")
+    params = {
+        "pageno": 1,
+        "strCat": "-1",
+        "strPrevDate": day,
+        "strScrip": "",
+        "strSearch": "P",
+        "strToDate": day,
+        "strType": "C",
+        "subcategory": "-1",
+    }
+    headers = {
+        "Accept": "application/json, text/plain, */*",
+        "Origin": "https://www.bseindia.com",
+        "Referer": "https://www.bseindia.com/",
+    }
+    orders: List[Dict] = []
+    seen_rows = 0
+    total: Optional[int] = None
+    try:
+        for page_num in range(1, BSE_ANN_API_MAX_PAGES + 1):
+            if stop_event.is_set():
+                break
+            params["pageno"] = page_num
+            r = SESSION.get(BSE_ANN_API_URL, params=params, headers=headers, timeout=BSE_ANN_API_TIMEOUT)
+            r.raise_for_status()
+            data = _json_loads(r.content)
+            table = data.get("Table") if isinstance(data, dict) else None
+            if not isinstance(table, list):
+                logger.info(f"Announcements API returned an unexpected payload for page {page_num}")
+                return None
+            if total is None:
+                total = _ann_api_rows_total(data)
+            if not table:
+                if page_num == 1 and total is None:
+                    return None
+                break
+            rows = [row for row in table if isinstance(row, dict)]
+            parsed = []
+            for row in rows:
+                title = _ann_api_text(row, "NEWSSUB")
+                summary = _ann_api_text(row, "HEADLINE")
+                if summary == title or len(summary) <= 10:
+                    summary = ""
+                parsed.append((title, summary))
+            start = len(orders)
+            for idx, (row, (title, summary), hit) in enumerate(zip(rows, parsed, match_order_announcements(parsed)), 1):
+                if not hit:
+                    continue
+                orders.append(_new_order(page_num, idx, _ann_api_text(row, "SLONGNAME"), title, summary, _ann_api_pdf_link(row)))
+            if prefetched is not None:
+                prefetch_order_pdfs(orders[start:], prefetched)
+            seen_rows += len(table)
+            if total is not None and seen_rows >= total:
+                break
+        else:
+            logger.info(f"Announcements API still had rows after {BSE_ANN_API_MAX_PAGES} pages, falling back to browser")
+            return None
+    except (requests.RequestException, ValueError, AttributeError, TypeError) as e:
+        logger.info(f"Announcements API unavailable, falling back to browser: {str(e)[:120]}")
+        return None
+    if total is not None and seen_rows < total and not stop_event.is_set():
+        logger.info(f"Announcements API returned {seen_rows} of {total} rows, falling back to browser")
+        return None
+    return orders, total if total is not None else seen_rows
+
+_ALLOWED_PDF_PREFIXES = ("https://www.bseindia.com/", "https://bseindia.com/", "https://api.bseindia.com/")
+
 def _is_allowed_pdf_url(url: str) -> bool:
+    return url.startswith(_ALLOWED_PDF_PREFIXES)
+
+def _declared_too_large(headers) -> bool:
     try:
-        parsed = urlparse(url)
-        if parsed.scheme != "https":
-            return False
-        host = parsed.hostname or ""
-        return host.endswith("bseindia.com")
-    except Exception:
+        return int(headers.get("Content-Length") or 0) > MAX_PDF_BYTES
+    except ValueError:
         return False
 
-def extract_pdf_text(content: bytes) -> str:
-    if HAS_PYPDF2:
+def _fetch_pdf_bytes_http2(pdf_url: str) -> Tuple[Optional[bytes], str]:
+    with HTTP2_CLIENT.stream("GET", pdf_url) as r:
+        r.raise_for_status()
+        if _declared_too_large(r.headers):
+            return None, "PDF too large to process"
+        buf = bytearray()
+        for chunk in r.iter_bytes(chunk_size=64 * 1024):
+            buf += chunk
+            if len(buf) > MAX_PDF_BYTES:
+                return None, "PDF too large to process"
+    return bytes(buf), ""
+
+def fetch_pdf_bytes(pdf_url: str) -> Tuple[Optional[bytes], str]:
+    if HTTP2_CLIENT is not None:
+        return _fetch_pdf_bytes_http2(pdf_url)
+    with SESSION.get(pdf_url, stream=True, timeout=PDF_TIMEOUT) as r:
+        r.raise_for_status()
+        if _declared_too_large(r.headers):
+            return None, "PDF too large to process"
+        buf = bytearray()
+        for chunk in r.iter_content(chunk_size=64 * 1024):
+            buf += chunk
+            if len(buf) > MAX_PDF_BYTES:
+                return None, "PDF too large to process"
+    return bytes(buf), ""
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+_PARSE_POOL_CONTEXT = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+def _get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    global _parse_pool
+    if PDF_PARSE_PROCESSES <= 0:
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=PDF_PARSE_PROCESSES,
+                mp_context=multiprocessing.get_context(_PARSE_POOL_CONTEXT),
+            )
+        return _parse_pool
+
+def _reset_parse_pool(pool: Optional[ProcessPoolExecutor] = None, terminate: bool = False):
+    global _parse_pool
+    with _parse_pool_lock:
+        if pool is None:
+            pool = _parse_pool
+        if _parse_pool is pool:
+            _parse_pool = None
+    if not pool:
+        return
+    if terminate:
+        for proc in list((getattr(pool, "_processes", None) or {}).values()):
+            try:
+                proc.terminate()
+            except Exception as e:
+                logger.debug(f"Could not terminate parse worker: {e}")
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _apply_pdf_result(order: Dict, values: List[Dict], snippet: str):
+    order["order_values"] = values
+    order["total_value_crores"] = round(sum(v.get("value_in_crores", 0) for v in values), 2)
+    order["pdf_extract"] = (snippet or "")[:500]
+
+_pdf_fetch_executor = ThreadPoolExecutor(max_workers=PDF_WORKERS, thread_name_prefix="pdf")
+atexit.register(_pdf_fetch_executor.shutdown, wait=False, cancel_futures=True)
+
+def _parse_pdf_content(content: bytes) -> Tuple[List[Dict], str]:
+    pool = _get_parse_pool()
+    if pool is not None:
         try:
-            reader = PyPDF2.PdfReader(io.BytesIO(content))
-            out = []
-            for page in reader.pages:
-                try:
-                    out.append(page.extract_text() or "")
-                except Exception:
-                    continue
-            if out:
-                return "\n".join(out)
+            fut = pool.submit(parse_pdf_bytes, content)
         except Exception as e:
-            logger.debug(f"PyPDF2 failed: {e}")
-    if HAS_PDFMINER:
+            logger.warning(f"PDF parse pool unavailable, parsing inline: {e}")
+            _reset_parse_pool(pool)
+            return parse_pdf_bytes(content, use_pdfium=False)
         try:
-            with io.BytesIO(content) as buf:
-                return pdfminer_extract_text(buf) or ""
+            return fut.result(timeout=PDF_PARSE_TIMEOUT)
+        except FuturesTimeoutError:
+            logger.warning("PDF parse worker hung, restarting the parse pool")
+            _reset_parse_pool(pool, terminate=True)
+            raise
         except Exception as e:
-            logger.debug(f"pdfminer failed: {e}")
-    return ""
-
-def extract_order_value_from_text(text: str) -> List[Dict]:
-    patterns = [
-        r"(?:rs\.?|inr|₹)\s*([\d,]+(?:\.\d+)?)\s*(crore|crores|cr)\b",
-        r"([\d,]+(?:\.\d+)?)\s*(crore|crores|cr)\b",
-        r"(?:rs\.?|inr|₹)\s*([\d,]+(?:\.\d+)?)\s*(lakh|lakhs)\b",
-        r"([\d,]+(?:\.\d+)?)\s*(lakh|lakhs)\b",
-        r"([\d,]+(?:\.\d+)?)\s*(million|mn|m)\b",
-        r"([\d,]+(?:\.\d+)?)\s*(billion|bn|b)\b",
-        r"(?:worth|value|amount)\s*(?:of\s*)?(?:rs\.?|inr|₹)?\s*([\d,]+(?:\.\d+)?)\s*(crore|crores|cr|lakh|lakhs|million|mn|m|billion|bn|b)\b",
-        r"(?:contract|order)\s*(?:worth|value|amount)?\s*(?:rs\.?|inr|₹)?\s*([\d,]+(?:\.\d+)?)\s*(crore|crores|cr|lakh|lakhs|million|mn|m|billion|bn|b)\b",
-    ]
-    def to_float(s: str) -> float:
-        return float(s.replace(",", ""))
-    def to_crores(value: float, unit: str) -> float:
-        u = unit.lower()
-        if u in ("crore", "crores", "cr"):
-            return value
-        if u in ("lakh", "lakhs"):
-            return value * 0.01
-        if u in ("million", "mn", "m"):
-            return value / 10.0
-        if u in ("billion", "bn", "b"):
-            return value * 100.0
-        return 0.0
-
-    found = []
-    lower = (text or "").lower()
-    for pat in patterns:
-        for m in re.finditer(pat, lower, re.IGNORECASE):
-            try:
-                value = to_float(m.group(1))
-                unit = m.group(2)
-                crores = to_crores(value, unit)
-                if crores <= 0:
-                    continue
-                found.append({
-                    "value": value,
-                    "unit": unit.lower(),
-                    "formatted": f"₹{value:,.2f} {unit}",
-                    "value_in_crores": round(crores, 4),
-                })
-            except Exception:
-                continue
-    dedup = []
-    seen = set()
-    for item in found:
-        key = (round(item["value"], 4), item["unit"])
-        if key not in seen:
-            seen.add(key)
-            dedup.append(item)
-    return dedup
-
-def fetch_pdf_and_extract_values(pdf_url: str) -> Tuple[List[Dict], str]:
-    if not _is_allowed_pdf_url(pdf_url):
-        return [], "PDF URL not allowed"
-
-    cached = _pdf_cache_get(pdf_url)
+            logger.warning(f"PDF parse worker failed, retrying without pdfium: {str(e)[:120]}")
+            if isinstance(e, BrokenProcessPool):
+                _reset_parse_pool(pool)
+            return parse_pdf_bytes(content, use_pdfium=False)
+    return parse_pdf_bytes(content)
+
+def _fetch_and_parse_pdf(url: str) -> Tuple[List[Dict], str]:
+    cached = _pdf_cache_get(url)
     if cached:
-        values, snippet = cached
-        return values, snippet
-
+        return cached
     try:
-        headers = {"User-Agent": UA}
-        try:
-            head = SESSION.head(pdf_url, headers=headers, allow_redirects=True)
-            clen = int(head.headers.get("Content-Length", "0")) if head.ok else 0
-            if clen and clen > MAX_PDF_BYTES:
-                return [], "PDF too large to process"
-        except Exception:
-            pass
-
-        r = SESSION.get(pdf_url, headers=headers)
-        r.raise_for_status()
-        if len(r.content) > MAX_PDF_BYTES:
-            return [], "PDF too large to process"
-
-        text = extract_pdf_text(r.content)
-        values = extract_order_value_from_text(text)
-        snippet = (text or "")[:500] or "No text extracted from PDF"
-
-        _pdf_cache_put(pdf_url, values, snippet)
-        return values, snippet
+        content, error = fetch_pdf_bytes(url)
+    except Exception as e:
+        logger.warning(f"PDF download failed: {str(e)[:120]}")
+        content, error = None, "PDF extraction failed"
+    if content is None:
+        _pdf_neg_cache_put(url, error)
+        return [], error
+    try:
+        values, snippet = _parse_pdf_content(content)
+    except FuturesTimeoutError:
+        return [], "PDF extraction timed out"
     except Exception as e:
         logger.warning(f"PDF extraction failed: {str(e)[:120]}")
+        _pdf_neg_cache_put(url, "PDF extraction failed")
         return [], "PDF extraction failed"
+    _pdf_cache_put(url, values, snippet)
+    return values, snippet
 
-def enrich_orders_with_pdfs(orders: List[Dict]):
-    def work(idx, url):
+def _order_pdf_url(order: Dict) -> Optional[str]:
+    url = order.get("pdf_link")
+    if url and url != "No PDF available" and _is_allowed_pdf_url(url):
+        return url
+    return None
+
+def prefetch_order_pdfs(orders: List[Dict], prefetched: Dict[str, Future]):
+    for o in orders:
+        url = _order_pdf_url(o)
+        if url and url not in prefetched:
+            prefetched[url] = _pdf_fetch_executor.submit(_fetch_and_parse_pdf, url)
+
+def enrich_orders_with_pdfs(orders: List[Dict], prefetched: Optional[Dict[str, Future]] = None):
+    prefetched = prefetched if prefetched is not None else {}
+    targets = []
+    for i, o in enumerate(orders):
+        url = _order_pdf_url(o)
+        if url:
+            fut = prefetched.get(url)
+            if fut is None or fut.cancelled():
+                fut = prefetched[url] = _pdf_fetch_executor.submit(_fetch_and_parse_pdf, url)
+            targets.append((i, url, fut))
+    wanted = {url for _, url, _ in targets}
+    for url, fut in prefetched.items():
+        if url not in wanted:
+            fut.cancel()
+    for idx, url, fut in targets:
         try:
-            values, snippet = fetch_pdf_and_extract_values(url)
-        except Exception:
-            values, snippet = [], "PDF extraction failed"
-        total_crores = round(sum(v.get("value_in_crores", 0) for v in values), 2)
-        return idx, values, total_crores, (snippet or "")[:500]
-
-    futures = {}
-    with ThreadPoolExecutor(max_workers=PDF_WORKERS) as ex:
-        for i, o in enumerate(orders):
-            url = o.get("pdf_link")
-            if url and url != "No PDF available" and _is_allowed_pdf_url(url):
-                futures[ex.submit(work, i, url)] = i
-        for fut in as_completed(futures):
-            idx, values, total, snippet = fut.result()
-            orders[idx]["order_values"] = values
-            orders[idx]["total_value_crores"] = total
-            orders[idx]["pdf_extract"] = snippet
+            result = fut.result(timeout=PDF_RESULT_TIMEOUT)
+        except FuturesTimeoutError:
+            fut.cancel()
+            logger.warning(f"PDF extraction timed out: {url[:120]}")
+            result = ([], "PDF extraction timed out")
+        _apply_pdf_result(orders[idx], *result)
+    prefetched.clear()
 
 def dedupe_orders(orders: List[Dict]) -> List[Dict]:
-    seen = set()
-    unique = []
+    unique: Dict[Tuple[str, str, str], Dict] = {}
     for o in orders:
-        key = (
+        key = o.pop("_dedup_key", None) or (
             (o.get("company") or "").strip().lower(),
             (o.get("title") or "").strip().lower(),
             (o.get("pdf_link") or "").strip().lower(),
         )
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(o)
-    return unique
+        unique.setdefault(key, o)
+    return list(unique.values())
+
+_ORDER_VALUE_KEY = itemgetter("total_value_crores")
+
+def compute_order_statistics(orders: List[Dict]) -> Tuple[float, Dict]:
+    total = 0.0
+    high = medium = low = none = 0
+    for v in map(_ORDER_VALUE_KEY, orders):
+        total += v
+        if v >= 100:
+            high += 1
+        elif v >= 10:
+            medium += 1
+        elif v > 0:
+            low += 1
+        elif v == 0:
+            none += 1
+    return round(total, 2), {
+        "high_value_count": high,
+        "medium_value_count": medium,
+        "low_value_count": low,
+        "no_value_count": none,
+    }
 
-_mem_cache: Dict[str, Tuple[datetime, Dict]] = {}
-_mem_cache_ttl = timedelta(minutes=CACHE_TTL_MINUTES)
+def _json_dumps(data) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+def _json_loads(raw: bytes):
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+_MEM_CACHE_SHARDS = 8
+_mem_cache: List[Tuple[Dict[str, Tuple[float, Optional[int], Dict]], threading.Lock]] = [({}, threading.Lock()) for _ in range(_MEM_CACHE_SHARDS)]
+_mem_cache_ttl = CACHE_TTL_MINUTES * 60
+
+def _mem_cache_shard(formatted_date: str) -> Tuple[Dict[str, Tuple[float, Optional[int], Dict]], threading.Lock]:
+    return _mem_cache[hash(formatted_date) % _MEM_CACHE_SHARDS]
 
 def _cache_path(formatted_date: str) -> Path:
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    safe = formatted_date.replace("/", "-")
+    return CACHE_DIR / f"{safe}.json.gz"
+
+def _legacy_cache_path(formatted_date: str) -> Path:
     safe = formatted_date.replace("/", "-")
     return CACHE_DIR / f"{safe}.json"
 
@@ -728,78 +1331,246 @@ def cache_load(formatted_date: str) -> Optional[Dict]:
     if is_today_formatted(formatted_date):
         return None
 
-    now = datetime.now(timezone.utc)
-    entry = _mem_cache.get(formatted_date)
-    if entry:
-        ts, data = entry
-        if now - ts <= _mem_cache_ttl:
-            return data
-        else:
-            _mem_cache.pop(formatted_date, None)
+    now = time.monotonic()
+    shard, lock = _mem_cache_shard(formatted_date)
+    with lock:
+        entry = shard.get(formatted_date)
+    if entry and now - entry[0] <= _mem_cache_ttl:
+        return entry[2]
 
     path = _cache_path(formatted_date)
-    if not path.exists():
-        return None
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        _mem_cache[formatted_date] = (now, data)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+            legacy = False
+        except FileNotFoundError:
+            path = _legacy_cache_path(formatted_date)
+            mtime_ns = path.stat().st_mtime_ns
+            legacy = True
+        if entry and entry[1] == mtime_ns:
+            data = entry[2]
+        else:
+            raw = path.read_bytes()
+            data = _json_loads(raw if legacy else gzip.decompress(raw))
+        with lock:
+            shard[formatted_date] = (now, mtime_ns, data)
         return data
+    except FileNotFoundError:
+        if entry:
+            with lock:
+                if shard.get(formatted_date) is entry:
+                    del shard[formatted_date]
+        return None
     except Exception as e:
         logger.debug(f"Cache load failed for {formatted_date}: {e}")
         return None
 
-def cache_save(formatted_date: str, data: Dict):
+_cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-writer")
+atexit.register(_cache_writer.shutdown, wait=True)
+
+def _cache_write(formatted_date: str, data: Dict):
     try:
-        now = datetime.now(timezone.utc)
-        _mem_cache[formatted_date] = (now, data)
         path = _cache_path(formatted_date)
-        tmp = path.with_suffix(".json.tmp")
+        tmp = path.with_suffix(".gz.tmp")
         path.parent.mkdir(parents=True, exist_ok=True)
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
+        tmp.write_bytes(gzip.compress(_json_dumps(data), compresslevel=3))
         os.replace(tmp, path)
-        _dates_index_add(formatted_date)
+        mtime_ns = path.stat().st_mtime_ns
+        shard, lock = _mem_cache_shard(formatted_date)
+        with lock:
+            entry = shard.get(formatted_date)
+            if entry and entry[2] is data:
+                shard[formatted_date] = (entry[0], mtime_ns, data)
     except Exception as e:
         logger.debug(f"Cache save failed for {formatted_date}: {e}")
 
+def cache_save(formatted_date: str, data: Dict):
+    shard, lock = _mem_cache_shard(formatted_date)
+    with lock:
+        shard[formatted_date] = (time.monotonic(), None, data)
+    try:
+        _cache_writer.submit(_cache_write, formatted_date, data)
+    except RuntimeError:
+        _cache_write(formatted_date, data)
+
+_scrape_executor = ThreadPoolExecutor(max_workers=SCRAPE_CONCURRENCY, thread_name_prefix="scraper")
+
 class ScrapeJob:
+    __slots__ = ("job_id", "formatted_date", "stop_event", "future", "lock", "snapshot", "finished_at_dt", "done", "on_done", "version", "spilled", "in_cache", "results", "body")
+
     def __init__(self, job_id: str, formatted_date: str):
         self.job_id = job_id
         self.formatted_date = formatted_date
         self.stop_event = threading.Event()
-        self.thread: Optional[threading.Thread] = None
-        self.lock = threading.Lock()
-        self.status = {
+        self.future: Optional[Future] = None
+        self.lock = threading.Condition(threading.Lock())
+        self.snapshot: Mapping = {
             "job_id": job_id,
             "is_running": False,
             "progress": 0,
             "message": "",
-            "results": None,
             "error": None,
             "total_announcements": 0,
             "started_at": None,
             "finished_at": None,
         }
-
-    def update(self, **kwargs):
+        self.finished_at_dt: Optional[datetime] = None
+        self.done = threading.Event()
+        self.on_done = None
+        self.version = 0
+        self.spilled = False
+        self.in_cache = False
+        self.results: Optional[Dict] = None
+        self.body: Optional[bytes] = None
+
+    def update(self, results: Optional[Dict] = None, **kwargs):
+        with self.lock:
+            if results is not None:
+                self.results = results
+            self.snapshot = {**self.snapshot, **kwargs}
+            self.version += 1
+            if kwargs.get("finished_at"):
+                self.finished_at_dt = datetime.now(timezone.utc)
+                self.done.set()
+            self.lock.notify_all()
+
+    def wait_for_change(self, seen: Mapping, timeout: float) -> Mapping:
         with self.lock:
-            self.status.update(kwargs)
+            if self.snapshot is seen:
+                self.lock.wait(timeout)
+            return self.snapshot
+
+    def get_status(self) -> Mapping:
+        return self.snapshot
+
+    def _spill_path(self) -> Path:
+        return JOB_SPILL_DIR / f"{self.job_id}.json.gz"
+
+    def spill(self):
+        results = self.results
+        if not results:
+            return
+        if not is_today_formatted(self.formatted_date) and _cache_path(self.formatted_date).exists():
+            with self.lock:
+                self.in_cache = True
+                self.results = None
+                self.body = None
+            return
+        path = self._spill_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".gz.tmp")
+            tmp.write_bytes(gzip.compress(self.body or _json_dumps(results), compresslevel=3))
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.debug(f"[{self.job_id}] Results spill failed: {e}")
+            return
+        with self.lock:
+            self.spilled = True
+            self.results = None
+            self.body = None
+
+    def _spilled_body(self) -> Optional[bytes]:
+        if self.in_cache:
+            results = cache_load(self.formatted_date)
+            return _json_dumps(results) if results else None
+        if not self.spilled:
+            return None
+        try:
+            return gzip.decompress(self._spill_path().read_bytes())
+        except Exception as e:
+            logger.debug(f"[{self.job_id}] Results reload failed: {e}")
+            return None
 
-    def get_status(self):
+    def load_results(self) -> Optional[Dict]:
+        results = self.results
+        if results is not None:
+            return results
+        if self.in_cache:
+            return cache_load(self.formatted_date)
+        body = self._spilled_body()
+        return _json_loads(body) if body else None
+
+    def results_body(self) -> Optional[bytes]:
+        body = self.body
+        if body is not None:
+            return body
+        results = self.results
+        if results is None:
+            return self._spilled_body()
+        body = _json_dumps(results)
         with self.lock:
-            return dict(self.status)
+            if self.results is results:
+                self.body = body
+        return body
+
+    def discard(self):
+        self.body = None
+        if self.spilled:
+            try:
+                self._spill_path().unlink()
+            except OSError:
+                pass
 
     def start(self):
-        self.thread = threading.Thread(target=self.run, name=f"scraper-{self.job_id[:8]}", daemon=True)
-        self.thread.start()
+        self.update(is_running=True, message="Queued")
+        try:
+            self.future = _scrape_executor.submit(self.run)
+        except Exception as e:
+            self.update(
+                is_running=False,
+                message="Scraping failed",
+                error=str(e),
+                finished_at=datetime.now(timezone.utc).isoformat(),
+            )
+            raise
 
     def stop(self):
         self.stop_event.set()
+        if self.future is not None and not self.done.is_set() and self.future.cancel():
+            self.update(
+                is_running=False,
+                progress=0,
+                message="Scraping stopped by user",
+                error="Stopped by user",
+                finished_at=datetime.now(timezone.utc).isoformat(),
+            )
+            if self.on_done:
+                self.on_done(self)
+            return
         self.update(message="Stop requested")
 
+    def _scrape_with_browser(self, driver: webdriver.Chrome, prefetched: Dict[str, Future]) -> Tuple[List[Dict], int]:
+        self.update(progress=20, message="Opening BSE announcements page...")
+        safe_get(driver, "https://www.bseindia.com/corporates/ann.html", wait_css="body")
+        accept_cookies_if_any(driver)
+        if self.stop_event.is_set():
+            raise InterruptedError("Stopped by user")
+
+        self.update(progress=30, message=f"Setting date to {self.formatted_date}...")
+        from_ok = set_date_field(driver, "txtFromDt", self.formatted_date, "From Date")
+        to_ok = set_date_field(driver, "txtToDt", self.formatted_date, "To Date")
+        if not (from_ok and to_ok):
+            logger.warning("Date fields may not have been set correctly, continuing...")
+
+        self.update(progress=40, message="Submitting form...")
+        if not submit_form(driver):
+            raise RuntimeError("Failed to submit form")
+
+        self.update(progress=50, message="Waiting for results...")
+        if not wait_for_results_or_empty(driver):
+            raise RuntimeError("Timed out waiting for announcement results")
+
+        total_announcements = get_total_announcements(driver)
+        self.update(total_announcements=total_announcements)
+
+        self.update(progress=60, message="Scanning announcements for order wins...")
+        return handle_pagination_and_scrape(driver, stop_event=self.stop_event, prefetched=prefetched), total_announcements
+
     def run(self):
         driver = None
+        driver_ok = True
+        prefetched: Dict[str, Future] = {}
         try:
             cached = cache_load(self.formatted_date)
             if cached:
@@ -815,34 +1586,17 @@ class ScrapeJob:
                 )
                 return
 
-            self.update(is_running=True, progress=10, message="Setting up browser...", started_at=datetime.now(timezone.utc).isoformat())
-            driver = setup_driver(headless=HEADLESS)
-
-            self.update(progress=20, message="Opening BSE announcements page...")
-            safe_get(driver, "https://www.bseindia.com/corporates/ann.html", wait_css="body")
-            accept_cookies_if_any(driver)
-            time.sleep(0.5)
+            self.update(is_running=True, progress=10, message="Fetching announcements...", started_at=datetime.now(timezone.utc).isoformat())
+            fetched = fetch_announcements_via_api(self.formatted_date, self.stop_event, prefetched) if BSE_ANN_API else None
             if self.stop_event.is_set():
                 raise InterruptedError("Stopped by user")
-
-            self.update(progress=30, message=f"Setting date to {self.formatted_date}...")
-            from_ok = set_date_field(driver, "txtFromDt", self.formatted_date, "From Date")
-            to_ok = set_date_field(driver, "txtToDt", self.formatted_date, "To Date")
-            if not (from_ok and to_ok):
-                logger.warning("Date fields may not have been set correctly, continuing...")
-
-            self.update(progress=40, message="Submitting form...")
-            if not submit_form(driver):
-                raise RuntimeError("Failed to submit form")
-
-            self.update(progress=50, message="Waiting for results...")
-            wait_for_results_or_empty(driver)
-
-            total_announcements = get_total_announcements(driver)
-            self.update(total_announcements=total_announcements)
-
-            self.update(progress=60, message="Scanning announcements for order wins...")
-            orders = handle_pagination_and_scrape(driver, stop_event=self.stop_event)
+            if fetched is not None:
+                orders, total_announcements = fetched
+                self.update(progress=60, total_announcements=total_announcements, message="Scanning announcements for order wins...")
+            else:
+                self.update(message="Setting up browser...")
+                driver = acquire_driver()
+                orders, total_announcements = self._scrape_with_browser(driver, prefetched)
             if self.stop_event.is_set():
                 raise InterruptedError("Stopped by user")
 
@@ -850,11 +1604,11 @@ class ScrapeJob:
 
             if orders:
                 self.update(progress=75, message="Analyzing PDFs for order values...")
-                enrich_orders_with_pdfs(orders)
+                enrich_orders_with_pdfs(orders, prefetched)
 
             if orders:
-                orders.sort(key=lambda x: x.get("total_value_crores", 0), reverse=True)
-                total_value = round(sum(o.get("total_value_crores", 0) for o in orders), 2)
+                orders.sort(key=_ORDER_VALUE_KEY, reverse=True)
+                total_value, statistics = compute_order_statistics(orders)
                 results = {
                     "success": True,
                     "date": self.formatted_date,
@@ -862,12 +1616,7 @@ class ScrapeJob:
                     "total_value_crores": total_value,
                     "total_announcements": total_announcements,
                     "orders": orders,
-                    "statistics": {
-                        "high_value_count": sum(1 for o in orders if o.get("total_value_crores", 0) >= 100),
-                        "medium_value_count": sum(1 for o in orders if 10 <= o.get("total_value_crores", 0) < 100),
-                        "low_value_count": sum(1 for o in orders if 0 < o.get("total_value_crores", 0) < 10),
-                        "no_value_count": sum(1 for o in orders if o.get("total_value_crores", 0) == 0),
-                    },
+                    "statistics": statistics,
                 }
             else:
                 results = {
@@ -899,59 +1648,219 @@ class ScrapeJob:
                 finished_at=datetime.now(timezone.utc).isoformat(),
             )
         except Exception as e:
+            driver_ok = False
             logger.exception(f"[{self.job_id}] Scraping failed")
             self.update(
                 is_running=False,
                 progress=0,
                 message="Scraping failed",
-                results=None,
                 error=str(e),
                 finished_at=datetime.now(timezone.utc).isoformat(),
             )
         finally:
-            try:
-                if driver:
-                    driver.quit()
-            except Exception:
-                pass
+            for fut in prefetched.values():
+                fut.cancel()
+            if driver:
+                release_driver(driver, reusable=driver_ok)
+            if self.on_done:
+                self.on_done(self)
+
+_JOB_DONE = threading.Event()
+_JOB_DONE.set()
+
+class CachedResultJob:
+    __slots__ = ("job_id", "formatted_date", "snapshot", "finished_at_dt", "version", "results", "body")
+    done = _JOB_DONE
+
+    def __init__(self, job_id: str, formatted_date: str, results: Dict, message: str, now: datetime, now_iso: str):
+        self.job_id = job_id
+        self.formatted_date = formatted_date
+        self.finished_at_dt = now
+        self.snapshot: Mapping = {
+            "job_id": job_id,
+            "is_running": False,
+            "progress": 100,
+            "message": message,
+            "error": None,
+            "total_announcements": 0,
+            "started_at": now_iso,
+            "finished_at": now_iso,
+        }
+        self.version = 1
+        self.results: Optional[Dict] = results
+        self.body: Optional[bytes] = None
+
+    def get_status(self) -> Mapping:
+        return self.snapshot
+
+    def spill(self):
+        self.results = None
+        self.body = None
+
+    def load_results(self) -> Optional[Dict]:
+        results = self.results
+        if results is not None:
+            return results
+        return cache_load(self.formatted_date)
+
+    def results_body(self) -> Optional[bytes]:
+        body = self.body
+        if body is not None:
+            return body
+        results = self.results
+        if results is None:
+            results = cache_load(self.formatted_date)
+            return _json_dumps(results) if results else None
+        body = self.body = _json_dumps(results)
+        return body
+
+    def discard(self):
+        self.body = None
+
+    def stop(self):
+        return
+
+    def wait_for_change(self, seen: Mapping, timeout: float) -> Mapping:
+        return self.snapshot
+
+SCRAPE_MANAGER_SHARD_BITS = 4
+
+def _new_job_id() -> str:
+    return secrets.token_urlsafe(9)
+
+def _job_shard_index(job_id: str) -> int:
+    key = hash(job_id)
+    return ((key * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> (64 - SCRAPE_MANAGER_SHARD_BITS)
 
 class MultiScrapeManager:
+    __slots__ = ("lock", "shards", "in_flight", "expiry", "expiry_lock", "finished")
+
     def __init__(self):
         self.lock = threading.Lock()
-        self.jobs: Dict[str, ScrapeJob] = {}
+        self.in_flight: Dict[str, str] = {}
+        self.shards: List[Tuple[threading.Lock, Dict[str, ScrapeJob]]] = [
+            (threading.Lock(), {}) for _ in range(1 << SCRAPE_MANAGER_SHARD_BITS)
+        ]
+        self.expiry: List[Tuple[datetime, str, bool]] = []
+        self.expiry_lock = threading.Lock()
+        self.finished: "OrderedDict[str, None]" = OrderedDict()
+        if not _IS_PARSE_WORKER:
+            threading.Thread(target=self._sweeper, name="job-sweeper", daemon=True).start()
+
+    def _shard(self, job_id: str) -> Tuple[threading.Lock, Dict[str, ScrapeJob]]:
+        return self.shards[_job_shard_index(job_id)]
+
+    def _schedule_expiry(self, job: ScrapeJob):
+        finished = job.finished_at_dt or datetime.now(timezone.utc)
+        evicted = []
+        with self.expiry_lock:
+            heapq.heappush(self.expiry, (finished + timedelta(minutes=JOB_TTL_MINUTES), job.job_id, True))
+            if 0 < JOB_SPILL_AFTER_MINUTES < JOB_TTL_MINUTES:
+                heapq.heappush(self.expiry, (finished + timedelta(minutes=JOB_SPILL_AFTER_MINUTES), job.job_id, False))
+            self.finished[job.job_id] = None
+            while len(self.finished) > MAX_FINISHED_JOBS:
+                evicted.append(self.finished.popitem(last=False)[0])
+        for jid in evicted:
+            self._evict(jid)
+
+    def _evict(self, jid: str):
+        lock, jobs = self._shard(jid)
+        with lock:
+            job = jobs.pop(jid, None)
+        if job:
+            job.discard()
 
     def _cleanup(self):
-        return
+        now = datetime.now(timezone.utc)
+        due = []
+        with self.expiry_lock:
+            while self.expiry and self.expiry[0][0] <= now:
+                due.append(heapq.heappop(self.expiry))
+        for _, jid, expire in due:
+            if not expire:
+                job = self.get(jid)
+                if job:
+                    job.spill()
+                continue
+            with self.expiry_lock:
+                self.finished.pop(jid, None)
+            self._evict(jid)
+
+    def _purge_stale_spills(self):
+        cutoff = time.time() - JOB_TTL_MINUTES * 60
+        try:
+            for path in JOB_SPILL_DIR.glob("*.json.gz"):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+        except OSError as e:
+            logger.debug(f"Spill purge failed: {e}")
+
+    def _sweeper(self):
+        while True:
+            self._purge_stale_spills()
+            time.sleep(JOB_SWEEP_SECONDS)
+            try:
+                self._cleanup()
+            except Exception as e:
+                logger.debug(f"Job sweep failed: {e}")
+
+    def register(self, job: ScrapeJob):
+        lock, jobs = self._shard(job.job_id)
+        with lock:
+            jobs[job.job_id] = job
+        if job.finished_at_dt is not None:
+            self._schedule_expiry(job)
+
+    def _job_finished(self, job: ScrapeJob):
+        with self.lock:
+            if self.in_flight.get(job.formatted_date) == job.job_id:
+                del self.in_flight[job.formatted_date]
+        self._schedule_expiry(job)
 
     def start(self, formatted_date: str) -> str:
         with self.lock:
-            for jid, job in self.jobs.items():
-                st = job.get_status()
-                if job.formatted_date == formatted_date and st.get("is_running"):
-                    return jid
-            job_id = uuid.uuid4().hex
+            jid = self.in_flight.get(formatted_date)
+            if jid and self.get(jid):
+                return jid
+            job_id = _new_job_id()
             job = ScrapeJob(job_id, formatted_date)
-            self.jobs[job_id] = job
-        job.start()
-        self._cleanup()
+            job.on_done = self._job_finished
+            self.register(job)
+            self.in_flight[formatted_date] = job_id
+        try:
+            job.start()
+        except Exception:
+            self._job_finished(job)
+            raise
         return job_id
 
     def get(self, job_id: str) -> Optional[ScrapeJob]:
-        with self.lock:
-            return self.jobs.get(job_id)
+        return self._shard(job_id)[1].get(job_id)
 
     def status(self, job_id: str):
         job = self.get(job_id)
         if not job:
             return None
-        return job.get_status()
+        return job.snapshot
 
     def results(self, job_id: str):
         job = self.get(job_id)
         if not job:
             return None
-        st = job.get_status()
-        return st.get("results")
+        return job.load_results()
+
+    def results_body(self, job_id: str) -> Optional[bytes]:
+        job = self.get(job_id)
+        if not job:
+            return None
+        return job.results_body()
+
+    def wait(self, job_id: str, timeout: float):
+        job = self.get(job_id)
+        if not job:
+            return None
+        job.done.wait(timeout)
+        return job.snapshot
 
     def stop(self, job_id: str):
         job = self.get(job_id)
@@ -960,15 +1869,46 @@ class MultiScrapeManager:
         job.stop()
         return True
 
+    def stop_all(self):
+        with self.lock:
+            jids = list(self.in_flight.values())
+        for jid in jids:
+            job = self.get(jid)
+            if job:
+                job.stop_event.set()
+
 scrape_manager = MultiScrapeManager()
 
-@app.route("/api/health", methods=["GET"])
-def health_check():
-    return jsonify({
+def _stop_scrapes_at_exit():
+    scrape_manager.stop_all()
+    _scrape_executor.shutdown(wait=False, cancel_futures=True)
+
+if not _IS_PARSE_WORKER:
+    getattr(threading, "_register_atexit", atexit.register)(_stop_scrapes_at_exit)
+
+def _request_now() -> Tuple[datetime, str]:
+    stamp = g.get("now")
+    if stamp is None:
+        now = datetime.now(timezone.utc)
+        stamp = g.now = (now, now.isoformat())
+    return stamp
+
+def _register_cached_job(formatted_date: str, cached: Dict) -> str:
+    job_id = _new_job_id()
+    scrape_manager.register(CachedResultJob(job_id, formatted_date, cached, "Served from cache", *_request_now()))
+    return job_id
+
+@lru_cache(maxsize=1)
+def _health_body(second: int) -> bytes:
+    return _json_dumps({
         "status": "healthy",
         "message": "BSE Scraper API is running",
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }), 200
+        "timestamp": datetime.fromtimestamp(second, timezone.utc).isoformat()
+    })
+
+@app.route("/api/health", methods=["GET"])
+def health_check():
+    return app.response_class(_health_body(int(time.time())), status=200, mimetype="application/json")
 
 @app.route("/api/scrape", methods=["POST"])
 def start_scrape():
@@ -981,64 +1921,20 @@ def start_scrape():
     if not payload or "date" not in payload:
         return jsonify({"error": "Date is required in format YYYY-MM-DD"}), 400
     try:
-        formatted_date, date_obj = validate_date(payload["date"])
+        formatted_date, _, readable_date = _validated_date(payload["date"], _now_in_config_tz().date())
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
 
     analysis_count = _increment_analysis_runs()
     logger.info(f"Analysis run #{analysis_count} started for date: {formatted_date}")
 
-    try:
-        if not is_today_formatted(formatted_date):
-            existing_dates = _dates_index_load()
-            if formatted_date in existing_dates:
-                cached = cache_load(formatted_date)
-                if cached:
-                    job_id = uuid.uuid4().hex
-                    job = ScrapeJob(job_id, formatted_date)
-                    now_iso = datetime.now(timezone.utc).isoformat()
-                    job.update(
-                        is_running=False,
-                        progress=100,
-                        message="Served from cache (index hit)",
-                        results=cached,
-                        error=None,
-                        started_at=now_iso,
-                        finished_at=now_iso,
-                    )
-                    with scrape_manager.lock:
-                        scrape_manager.jobs[job_id] = job
-                    return jsonify({
-                        "message": "Scraping started (cache hit via index)",
-                        "date": formatted_date,
-                        "readable_date": date_obj.strftime("%B %d, %Y"),
-                        "job_id": job_id,
-                        "analysis_run_number": analysis_count
-                    }), 202
-    except Exception:
-        pass
-
     cached = cache_load(formatted_date)
     if cached:
-        job_id = uuid.uuid4().hex
-        job = ScrapeJob(job_id, formatted_date)
-        now_iso = datetime.now(timezone.utc).isoformat()
-        job.update(
-            is_running=False,
-            progress=100,
-            message="Served from cache",
-            results=cached,
-            error=None,
-            started_at=now_iso,
-            finished_at=now_iso,
-        )
-        with scrape_manager.lock:
-            scrape_manager.jobs[job_id] = job
         return jsonify({
             "message": "Scraping started (cache hit)",
             "date": formatted_date,
-            "readable_date": date_obj.strftime("%B %d, %Y"),
-            "job_id": job_id,
+            "readable_date": readable_date,
+            "job_id": _register_cached_job(formatted_date, cached),
             "analysis_run_number": analysis_count
         }), 202
 
@@ -1051,11 +1947,61 @@ def start_scrape():
     return jsonify({
         "message": "Scraping started",
         "date": formatted_date,
-        "readable_date": date_obj.strftime("%B %d, %Y"),
+        "readable_date": readable_date,
         "job_id": job_id,
         "analysis_run_number": analysis_count
     }), 202
 
+@app.route("/api/scrape_range", methods=["POST"])
+def start_scrape_range():
+    if not _require_api_key():
+        return jsonify({"error": "Unauthorized"}), 401
+    try:
+        payload = request.get_json(force=True, silent=False)
+    except Exception:
+        return jsonify({"error": "Invalid JSON body"}), 400
+    if not payload or "start_date" not in payload or "end_date" not in payload:
+        return jsonify({"error": "start_date and end_date are required in format YYYY-MM-DD"}), 400
+    today = _now_in_config_tz().date()
+    try:
+        _, start_dt, _ = _validated_date(payload["start_date"], today)
+        _, end_dt, _ = _validated_date(payload["end_date"], today)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if end_dt < start_dt:
+        return jsonify({"error": "end_date cannot be before start_date"}), 400
+    days = (end_dt - start_dt).days + 1
+    if days > MAX_RANGE_DAYS:
+        return jsonify({"error": f"At most {MAX_RANGE_DAYS} days per request"}), 400
+
+    analysis_count = _increment_analysis_runs()
+    logger.info(f"Analysis run #{analysis_count} started for {days} dates: {payload['start_date']} to {payload['end_date']}")
+
+    jobs = {}
+    cached_dates = []
+    for i in range(days):
+        formatted_date = (start_dt + timedelta(days=i)).strftime("%d/%m/%Y")
+        cached = cache_load(formatted_date)
+        if cached:
+            job_id = _register_cached_job(formatted_date, cached)
+            cached_dates.append(formatted_date)
+        else:
+            try:
+                job_id = scrape_manager.start(formatted_date)
+            except Exception:
+                logger.exception(f"Failed to start scraper for {formatted_date}")
+                return jsonify({"error": "Failed to start scraping", "jobs": jobs}), 500
+        jobs[formatted_date] = job_id
+
+    return jsonify({
+        "message": "Scraping started",
+        "start_date": payload["start_date"],
+        "end_date": payload["end_date"],
+        "jobs": jobs,
+        "cached_dates": cached_dates,
+        "analysis_run_number": analysis_count
+    }), 202
+
 @app.route("/api/status", methods=["GET"])
 def get_status():
     if not _require_api_key():
@@ -1063,10 +2009,53 @@ def get_status():
     job_id = request.args.get("job_id", "").strip()
     if not job_id:
         return jsonify({"error": "job_id is required"}), 400
-    st = scrape_manager.status(job_id)
-    if not st:
+    if "," in job_id:
+        job_ids = [jid for jid in (j.strip() for j in job_id.split(",")) if jid]
+        if len(job_ids) > MAX_STATUS_BATCH:
+            return jsonify({"error": f"At most {MAX_STATUS_BATCH} job_ids per request"}), 400
+        return jsonify({"jobs": {jid: scrape_manager.status(jid) for jid in job_ids}}), 200
+    job = scrape_manager.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    etag = str(job.version)
+    if request.if_none_match.contains_weak(etag):
+        resp = app.response_class(status=304)
+    else:
+        resp = jsonify(job.snapshot)
+    resp.set_etag(etag, weak=True)
+    resp.headers["Cache-Control"] = "private, no-cache"
+    return resp
+
+@app.route("/api/events", methods=["GET"])
+def job_events():
+    if not _require_api_key():
+        return jsonify({"error": "Unauthorized"}), 401
+    job_id = request.args.get("job_id", "").strip()
+    if not job_id:
+        return jsonify({"error": "job_id is required"}), 400
+    job = scrape_manager.get(job_id)
+    if not job:
         return jsonify({"error": "Job not found"}), 404
-    return jsonify(st), 200
+
+    def stream():
+        deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+        st = job.snapshot
+        yield f"retry: {SSE_RETRY_MS}\ndata: {app.json.dumps(st)}\n\n"
+        while not job.done.is_set() or job.snapshot is not st:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            nxt = job.wait_for_change(st, min(SSE_KEEPALIVE_SECONDS, remaining))
+            if nxt is st:
+                yield ": keepalive\n\n"
+                continue
+            st = nxt
+            yield f"data: {app.json.dumps(st)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return Response(stream(), mimetype="text/event-stream", headers={"X-Accel-Buffering": "no"})
+
+_results_waiters = threading.BoundedSemaphore(RESULTS_MAX_WAITERS) if RESULTS_MAX_WAITERS else None
 
 @app.route("/api/results", methods=["GET"])
 def get_results():
@@ -1075,14 +2064,30 @@ def get_results():
     job_id = request.args.get("job_id", "").strip()
     if not job_id:
         return jsonify({"error": "job_id is required"}), 400
-    res = scrape_manager.results(job_id)
-    st = scrape_manager.status(job_id)
-    if res:
-        return jsonify(res), 200
-    if st and st.get("error"):
-        return jsonify({"error": st["error"]}), 500
-    if st and st.get("is_running"):
+    wait = min(max(request.args.get("wait", 0.0, type=float), 0.0), RESULTS_MAX_WAIT_SECONDS)
+    if wait and _results_waiters is not None and _results_waiters.acquire(blocking=False):
+        try:
+            scrape_manager.wait(job_id, wait)
+        finally:
+            _results_waiters.release()
+    job = scrape_manager.get(job_id)
+    if not job:
+        return jsonify({"message": "No results available"}), 404
+    if not job.done.is_set():
         return jsonify({"message": "Scraping is in progress"}), 202
+    etag = f"r{job.version}"
+    if request.if_none_match.contains_weak(etag):
+        resp = app.response_class(status=304)
+    else:
+        body = job.results_body()
+        resp = app.response_class(body, status=200, mimetype="application/json") if body else None
+    if resp is not None:
+        resp.set_etag(etag, weak=True)
+        resp.headers["Cache-Control"] = "private, no-cache"
+        return resp
+    error = job.snapshot.get("error")
+    if error:
+        return jsonify({"error": error}), 500
     return jsonify({"message": "No results available"}), 404
 
 @app.route("/api/stop", methods=["POST"])